@@ -1,44 +1,64 @@
-import requests
-import json
-import time
+import asyncio
+import contextlib
+import httpx
+import orjson
 import os
+import re
+import time
+from types import MappingProxyType
+from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, MofNCompleteColumn
 
+_BASE_PARAMS = MappingProxyType({'pr': 'ucpro', 'fr': 'pc', 'uc_param_str': ''})
+_ARCHIVE_RE = re.compile(r'\.(?:zip|rar|7z|tar\.(?:gz|xz|bz2)|tar|gz)$', re.IGNORECASE)
+
+class _AsyncLimiter:
+    """
+    Spaces requests at least 1/rate seconds apart, waiting only for the remainder of the current slot.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next_slot = 0.0
+
+    async def __aenter__(self):
+        now = time.monotonic()
+        wait = max(0.0, self._next_slot - now)
+        self._next_slot = max(now, self._next_slot) + self.interval
+        if wait:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
 class QuarkAPI:
     """
     A class to interact with the Quark Drive API for unzipping, organizing, and cleaning files.
     It uses the rich library for enhanced output and automatically retries failed tasks.
     """
 
-    def __init__(self, cookie: str, debug: bool = False):
+    def __init__(self, cookie: str, debug: bool = False, concurrency: int = 8, requests_per_second: float = 10.0):
         self.console = Console()
         self.debug = debug
-        self.session = requests.Session()
+        self.concurrency = concurrency
+        self._limiter = _AsyncLimiter(requests_per_second)
+        # Retry passes run at a quarter of the normal rate so rate-limit failures get room to clear.
+        self._retry_limiter = _AsyncLimiter(requests_per_second / 4)
+        self._active_limiter = self._limiter
+        self.client = None
+        self._client_depth = 0
+        self._dir_cache: dict[str, list] = {}
+        self._path_cache: dict[tuple, str] = {}
+        self._status_key: Optional[str] = None
         
         self.console.print(Panel("[bold cyan]Quark API Initializing...[/]", title="[yellow]Status[/]", border_style="green"))
         
-        self.session.headers['Cookie'] = cookie
-        if not self.session.headers['Cookie']:
+        if not cookie:
             raise ValueError("Cookie is missing or empty.")
-
-        self._log_debug("QuarkAPI initialized successfully with the provided cookie.")
-
-    def _log_debug(self, message: str):
-        if self.debug:
-            self.console.print(f"[bold yellow]DEBUG:[/] {message}")
-
-    def _make_request(self, method: str, url: str, **kwargs) -> dict:
-        base_params = {'pr': 'ucpro', 'fr': 'pc', 'uc_param_str': ''}
-        final_params = base_params.copy()
-        if 'params' in kwargs:
-            final_params.update(kwargs.pop('params', {}))
-
-        full_url = f"https://drive-pc.quark.cn/1/clouddrive{url}"
-        
-        request_headers = {
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8,zh-TW;q=0.7',
@@ -46,203 +66,333 @@ class QuarkAPI:
             'Origin': 'https://pan.quark.cn', 'Referer': 'https://pan.quark.cn/',
             'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"', 'sec-ch-ua-mobile': '?0',
             'sec-ch-ua-platform': '"Windows"', 'sec-fetch-dest': 'empty', 'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'same-site', 'priority': 'u=1, i', 'Cookie': self.session.headers.get('Cookie')
+            'sec-fetch-site': 'same-site', 'priority': 'u=1, i', 'Cookie': cookie
         }
 
-        if 'data' in kwargs:
-            kwargs['data'] = json.dumps(kwargs['data'])
-            request_headers['Content-Type'] = 'application/json;charset=UTF-8'
+        if self.debug:
+            self._log_debug("QuarkAPI initialized successfully with the provided cookie.")
+
+    async def __aenter__(self):
+        # Nested 'async with' blocks (e.g. unzip_all_in_path inside a caller's block) share the outermost client.
+        if self._client_depth == 0:
+            limits = httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=60)
+            self.client = httpx.AsyncClient(http2=True, headers=self.headers, limits=limits, timeout=30.0)
+            self._dir_cache.clear()
+            self._path_cache.clear()
+        self._client_depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._client_depth -= 1
+        if self._client_depth == 0:
+            await self.client.aclose()
+            self.client = None
+
+    @contextlib.contextmanager
+    def _retry_pacing(self):
+        self._active_limiter = self._retry_limiter
+        try:
+            yield
+        finally:
+            self._active_limiter = self._limiter
+
+    def _log_debug(self, message: str):
+        if not self.debug:
+            return
+        self.console.print(f"[bold yellow]DEBUG:[/] {message}")
+
+    async def _make_request(self, method: str, url: str, **kwargs) -> dict:
+        if self.client is None:
+            raise RuntimeError("QuarkAPI must be used inside 'async with'")
+        final_params = {**_BASE_PARAMS, **(kwargs.pop('params', None) or {})}
+
+        full_url = f"https://drive-pc.quark.cn/1/clouddrive{url}"
+        
+        payload = kwargs.pop('data', None)
+        if payload is not None:
+            kwargs['content'] = orjson.dumps(payload)
+            kwargs.setdefault('headers', {})['Content-Type'] = 'application/json;charset=UTF-8'
 
-        self._log_debug(f"Request -> {method} {full_url}")
         if self.debug:
-            try:
-                parsed_json = json.loads(json.dumps(request_headers))
-                pretty_response = json.dumps(parsed_json, indent=2, ensure_ascii=False)
-                self.console.print(Syntax(pretty_response, "json", theme="monokai", line_numbers=True))
-            except json.JSONDecodeError:
-                self.console.print(f"[yellow]Request headers are not valid JSON, printing raw:[/]\n{request_headers}")
+            self._log_debug(f"Request -> {method} {full_url}")
+            request_headers = {**self.headers, **kwargs.get('headers', {})}
+            self.console.print(Syntax(orjson.dumps(request_headers, option=orjson.OPT_INDENT_2).decode(), "json", theme="monokai", line_numbers=True))
+            if payload is not None:
+                self._log_debug("Request body:")
+                self.console.print(Syntax(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode(), "json", theme="monokai", line_numbers=True))
 
-        response = self.session.request(method, full_url, headers=request_headers, params=final_params, **kwargs)
+        async with self._active_limiter:
+            response = await self.client.request(method, full_url, params=final_params, **kwargs)
+        response_body = response.content
         
-        self._log_debug(f"Response <- Status Code: {response.status_code}")
         if self.debug:
+            self._log_debug(f"Response <- Status Code: {response.status_code} ({response.http_version})")
             try:
-                parsed_json = json.loads(response.text)
-                pretty_response = json.dumps(parsed_json, indent=2, ensure_ascii=False)
+                parsed_json = orjson.loads(response_body)
+                pretty_response = orjson.dumps(parsed_json, option=orjson.OPT_INDENT_2).decode()
                 self.console.print(Syntax(pretty_response, "json", theme="monokai", line_numbers=True))
-            except json.JSONDecodeError:
-                self.console.print(f"[yellow]Response is not valid JSON, printing raw:[/]\n{response.text}")
+            except orjson.JSONDecodeError:
+                self.console.print(f"[yellow]Response is not valid JSON, printing raw:[/]\n{response_body.decode(errors='replace')}")
 
         if response.status_code != 200:
-            raise requests.HTTPError(f"Request failed: {response.status_code}, URL: {full_url}")
+            raise httpx.HTTPStatusError(f"Request failed: {response.status_code}, URL: {full_url}", request=response.request, response=response)
         
-        data = response.json()
-        if data.get("code") != 0 and data.get("status") != 0:
-            raise Exception(f"API returned a business error: {data.get('message') or response.text}")
+        data = orjson.loads(response_body)
+        if self._status_key is None:
+            # Until a success shows which field the API reports through, accept either one.
+            if data.get("code") != 0 and data.get("status") != 0:
+                raise Exception(f"API returned a business error: {data.get('message') or response_body.decode(errors='replace')}")
+            self._status_key = "code" if data.get("code") == 0 else "status"
+        elif data.get(self._status_key) != 0:
+            raise Exception(f"API returned a business error: {data.get('message') or response_body.decode(errors='replace')}")
         return data
 
-    def get_files_by_pid(self, p_fid: str) -> list:
-        self._log_debug(f"Fetching file list for parent ID: '{p_fid}'...")
-        params = {'pdir_fid': p_fid, '_page': 1, '_size': 500, '_sort': 'file_type:asc,updated_at:desc'}
-        data = self._make_request("GET", "/file/sort", params=params)
-        return data.get("data", {}).get("list", [])
+    def _invalidate_dir_cache(self, item_fids: list[str], *p_fids: str):
+        # Drop the given parents, the items themselves, and any listing that contains one of the items.
+        # Moved or deleted items may sit anywhere under a resolved path, so resolved paths are dropped wholesale.
+        self._path_cache.clear()
+        item_fids = set(item_fids)
+        for cached_fid in list(self._dir_cache):
+            if cached_fid in p_fids or cached_fid in item_fids or any(item.get("fid") in item_fids for item in self._dir_cache[cached_fid]):
+                del self._dir_cache[cached_fid]
+
+    async def _iter_file_pages(self, p_fid: str, page_size: int):
+        page, seen, previous_fids = 1, 0, None
+        while True:
+            params = {'pdir_fid': p_fid, '_page': page, '_size': page_size, '_sort': 'file_type:asc,updated_at:desc'}
+            data = await self._make_request("GET", "/file/sort", params=params)
+            files = data.get("data", {}).get("list", [])
+            # A server that ignores _page keeps returning the same full page; stop instead of looping forever.
+            page_fids = [item.get("fid") for item in files]
+            if page_fids == previous_fids:
+                return
+            yield files
+            seen += len(files)
+            total = data.get("metadata", {}).get("_total")
+            if len(files) < page_size or (total is not None and seen >= total):
+                return
+            previous_fids = page_fids
+            page += 1
+
+    async def get_files_by_pid(self, p_fid: str, force: bool = False, page_size: int = 100) -> list:
+        # Callers always get their own list so mutating it cannot corrupt the cache.
+        if p_fid in self._dir_cache and not force:
+            if self.debug:
+                self._log_debug(f"Using cached file list for parent ID: '{p_fid}'")
+            return list(self._dir_cache[p_fid])
+        if self.debug:
+            self._log_debug(f"Fetching file list for parent ID: '{p_fid}'...")
+        files = []
+        async for page_files in self._iter_file_pages(p_fid, page_size):
+            files.extend(page_files)
+        self._dir_cache[p_fid] = files
+        return list(files)
+
+    async def _find_child(self, p_fid: str, name: str, page_size: int = 100) -> Optional[dict]:
+        if p_fid in self._dir_cache:
+            return next((item for item in self._dir_cache[p_fid] if item.get("file_name") == name), None)
+        # Stop paging as soon as the name turns up instead of listing the whole directory.
+        async for page_files in self._iter_file_pages(p_fid, page_size):
+            item = next((item for item in page_files if item.get("file_name") == name), None)
+            if item is not None:
+                return item
+        return None
 
-    def move_files(self, file_fids: list[str], to_pdir_fid: str):
+    async def move_files(self, file_fids: list[str], to_pdir_fid: str):
         payload = {"action_type": 1, "to_pdir_fid": to_pdir_fid, "filelist": file_fids, "exclude_fids": []}
-        self._make_request("POST", "/file/move", data=payload)
+        await self._make_request("POST", "/file/move", data=payload)
+        self._invalidate_dir_cache(file_fids, to_pdir_fid)
 
-    def delete_items(self, item_fids: list[str]):
+    async def delete_items(self, item_fids: list[str]):
         payload = {"action_type": 2, "filelist": item_fids, "exclude_fids": []}
-        self._make_request("POST", "/file/delete", data=payload)
-
-    def get_fid_by_path(self, path: str) -> str:
-        self._log_debug(f"Starting path resolution for: '{path}'")
-        if path == '/': return "0"
-        path_parts = [part for part in path.strip().split('/') if part]
-        current_fid = "0"
-
-        for part in path_parts:
-            files_in_dir = self.get_files_by_pid(current_fid)
-            found = False
-            for item in files_in_dir:
-                if item.get("file_name") == part:
-                    current_fid = item["fid"]
-                    found = True
-                    break
-            if not found:
+        await self._make_request("POST", "/file/delete", data=payload)
+        self._invalidate_dir_cache(item_fids)
+
+    async def get_fid_by_path(self, path: str) -> str:
+        if self.debug:
+            self._log_debug(f"Starting path resolution for: '{path}'")
+        path_parts = tuple(part for part in path.strip().split('/') if part)
+        if not path_parts: return "0"
+        if path_parts in self._path_cache:
+            return self._path_cache[path_parts]
+
+        # Resume from the deepest prefix that has already been resolved.
+        depth = len(path_parts) - 1
+        while depth > 0 and path_parts[:depth] not in self._path_cache:
+            depth -= 1
+        current_fid = self._path_cache[path_parts[:depth]] if depth else "0"
+
+        for depth in range(depth + 1, len(path_parts) + 1):
+            part = path_parts[depth - 1]
+            item = await self._find_child(current_fid, part)
+            if item is None:
                 raise FileNotFoundError(f"Could not find '{part}' in path '{path}'.")
+            current_fid = item["fid"]
+            self._path_cache[path_parts[:depth]] = current_fid
         
         self.console.print(f"[bold magenta]Path resolved successfully:[/] FID for '{path}' is [bold green]{current_fid}[/]")
         return current_fid
 
-    def _unzip_task(self, files_to_process: list, target_dir_fid: str, delay: float, description: str) -> tuple[list, list]:
+    async def _unzip_task(self, files_to_process: list, target_dir_fid: str, description: str, progress: Progress) -> tuple[list, list]:
         successfully_unzipped, failed_to_unzip = [], []
-        progress_columns = [TextColumn("[progress.description]{task.description}"), BarColumn(), MofNCompleteColumn(), TextColumn("[progress.percentage]{task.percentage:>3.0f}%"), TimeRemainingColumn()]
-        
-        with Progress(*progress_columns, console=self.console) as progress:
-            task = progress.add_task(f"[cyan]{description}[/]", total=len(files_to_process))
-            for file_info in files_to_process:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        task = progress.add_task(f"[cyan]{description}[/]", total=len(files_to_process))
+
+        async def unzip_one(file_info: dict):
+            async with semaphore:
                 file_name, file_id = file_info["file_name"], file_info["fid"]
-                progress.log(f"  -> [cyan]Requesting unzip for:[/] {file_name}")
                 payload = {"fid": file_id, "pwd": "", "select_mode": 2, "path_no_list": [1], "curr_path_no": 0, "remember_pwd": False, "conflict_mode": 3, "suffix_type": 0, "to_pdir_fid": target_dir_fid}
                 try:
-                    self._make_request("POST", "/archive/unarchive", data=payload)
-                    progress.log(f"     [bold green]✅ Unzip request successful:[/] {file_name}")
+                    await self._make_request("POST", "/archive/unarchive", data=payload)
+                    self._dir_cache.pop(target_dir_fid, None)
                     successfully_unzipped.append(file_info)
                 except Exception as e:
                     progress.log(f"     [bold red]❌ Unzip request failed:[/] {file_name}. Reason: {e}")
                     failed_to_unzip.append(file_info)
                 progress.update(task, advance=1)
-                time.sleep(delay)
+
+        await asyncio.gather(*[unzip_one(file_info) for file_info in files_to_process])
         return successfully_unzipped, failed_to_unzip
 
-    def _organize_task(self, files_to_process: list, target_dir_fid: str, delay: float, description: str) -> tuple[list, list]:
+    async def _organize_task(self, files_to_process: list, target_dir_fid: str, created_after_ms: int, description: str, progress: Progress) -> tuple[list, list]:
         organized_folders, failed_to_organize = [], []
-        progress_columns = [TextColumn("[progress.description]{task.description}"), BarColumn(), MofNCompleteColumn(), TextColumn("[progress.percentage]{task.percentage:>3.0f}%"), TimeRemainingColumn()]
+        semaphore = asyncio.Semaphore(self.concurrency)
         
-        self.console.print("[cyan]Refreshing directory to find newly created folders...[/]")
-        all_files_in_dir = self.get_files_by_pid(target_dir_fid)
-
-        with Progress(*progress_columns, console=self.console) as progress:
-            task = progress.add_task(f"[cyan]{description}[/]", total=len(files_to_process))
-            for file_info in files_to_process:
-                file_name = file_info["file_name"]
-                progress.log(f"  -> [cyan]Organizing:[/] {file_name}")
+        progress.log("[cyan]Refreshing directory to find newly created folders...[/]")
+        all_files_in_dir = await self.get_files_by_pid(target_dir_fid, force=True)
+        # The listing is sorted newest first; keep the first folder per name so a freshly extracted folder wins over an older namesake.
+        name_to_folder = {}
+        for item in all_files_in_dir:
+            if item.get("dir"):
+                name_to_folder.setdefault(item.get("file_name"), item)
+
+        found_folders = []
+        for file_info in files_to_process:
+            unzipped_folder_name = os.path.splitext(file_info["file_name"])[0]
+            folder = name_to_folder.get(unzipped_folder_name)
+            if not folder:
+                progress.log(f"     [yellow]Warning: Could not find a matching unzipped folder for {file_info['file_name']}, skipping move.[/]")
+            elif folder.get("created_at", 0) < created_after_ms:
+                # A folder older than the unzip request is one the user already had; moving and deleting it would lose data.
+                progress.log(f"     [yellow]Warning: Folder '{unzipped_folder_name}' predates the unzip of {file_info['file_name']}, skipping move.[/]")
+            else:
+                found_folders.append((file_info, unzipped_folder_name, folder["fid"]))
+        task = progress.add_task(f"[cyan]{description}[/]", total=len(found_folders))
+
+        async def list_folder(folder_fid: str) -> list:
+            async with semaphore:
                 try:
-                    unzipped_folder_name = os.path.splitext(file_name)[0]
-                    new_folder_fid = None
-                    for item in all_files_in_dir:
-                        if item.get("file_name") == unzipped_folder_name and item.get("dir"):
-                            new_folder_fid = item["fid"]
-                            break
-                    
-                    if new_folder_fid:
-                        progress.log(f"     [green]Found new folder, preparing to move contents...[/]")
-                        files_to_move = self.get_files_by_pid(new_folder_fid)
-                        if files_to_move:
-                            fids_to_move = [item['fid'] for item in files_to_move]
-                            self.move_files(fids_to_move, target_dir_fid)
-                            progress.log("     [bold green]✅ Files moved successfully![/]")
-                        else:
-                            progress.log("     [yellow]New folder is empty, no move needed.[/]")
-                        organized_folders.append({"file_name": unzipped_folder_name, "fid": new_folder_fid})
-                    else:
-                        progress.log(f"     [yellow]Warning: Could not find a matching unzipped folder, skipping move.[/]")
-                except Exception as e:
-                    progress.log(f"     [bold red]❌ Organization failed:[/] {file_name}. Reason: {e}")
-                    failed_to_organize.append(file_info)
-                progress.update(task, advance=1)
-                time.sleep(delay)
+                    return await self.get_files_by_pid(folder_fid)
+                finally:
+                    progress.update(task, advance=1)
+
+        listings = await asyncio.gather(*[list_folder(folder_fid) for _, _, folder_fid in found_folders], return_exceptions=True)
+        for (file_info, unzipped_folder_name, new_folder_fid), listing in zip(found_folders, listings):
+            if isinstance(listing, Exception):
+                progress.log(f"     [bold red]❌ Organization failed:[/] {file_info['file_name']}. Reason: {listing}")
+                failed_to_organize.append(file_info)
+            else:
+                child_fids = [item['fid'] for item in listing]
+                organized_folders.append({"file_name": unzipped_folder_name, "fid": new_folder_fid, "child_fids": child_fids})
         return organized_folders, failed_to_organize
 
-    def _cleanup_task(self, folders_to_delete: list, delay: float, description: str) -> list:
+    async def _move_task(self, organized_folders: list, target_dir_fid: str, description: str, progress: Progress) -> list:
+        failed_to_move = []
+        fids_to_move = [fid for folder_info in organized_folders for fid in folder_info["child_fids"]]
+        task = progress.add_task(f"[cyan]{description}[/]", total=len(organized_folders))
+
+        if fids_to_move:
+            try:
+                await self.move_files(fids_to_move, target_dir_fid)
+            except Exception as e:
+                progress.log(f"     [bold red]❌ Move failed. Reason: {e}[/]")
+                failed_to_move.extend(organized_folders)
+        progress.update(task, advance=len(organized_folders))
+        return failed_to_move
+
+    async def _cleanup_task(self, items_to_delete: list, description: str, progress: Progress) -> list:
         failed_to_delete = []
-        progress_columns = [TextColumn("[progress.description]{task.description}"), BarColumn(), MofNCompleteColumn(), TextColumn("[progress.percentage]{task.percentage:>3.0f}%"), TimeRemainingColumn()]
-        
-        with Progress(*progress_columns, console=self.console) as progress:
-            task = progress.add_task(f"[cyan]{description}[/]", total=len(folders_to_delete))
-            for folder_info in folders_to_delete:
-                folder_name, folder_id = folder_info["file_name"], folder_info["fid"]
-                progress.log(f"  -> [cyan]Requesting deletion of empty folder:[/] {folder_name}")
-                try:
-                    self.delete_items([folder_id])
-                    progress.log(f"     [bold green]✅ Deletion successful:[/] {folder_name}")
-                except Exception as e:
-                    progress.log(f"     [bold red]❌ Deletion failed:[/] {folder_name}. Reason: {e}")
-                    failed_to_delete.append(folder_info)
-                progress.update(task, advance=1)
-                time.sleep(delay)
+        task = progress.add_task(f"[cyan]{description}[/]", total=len(items_to_delete))
+
+        try:
+            await self.delete_items([item_info["fid"] for item_info in items_to_delete])
+        except Exception as e:
+            progress.log(f"     [bold red]❌ Deletion failed. Reason: {e}[/]")
+            failed_to_delete.extend(items_to_delete)
+        progress.update(task, advance=len(items_to_delete))
         return failed_to_delete
 
-    def unzip_all_in_path(self, dir_path: str, delete_source_files: bool):
+    async def unzip_all_in_path(self, dir_path: str, delete_source_files: bool):
         self.console.print(f"[cyan]Processing path:[/] {dir_path}")
         try:
-            target_dir_fid = self.get_fid_by_path(dir_path)
-            all_compressed_files = [f for f in self.get_files_by_pid(target_dir_fid) if not f.get("dir") and f.get("file_name", "").split('.')[-1] in ['zip', 'rar', '7z', 'tar', 'gz']]
+            async with self:
+                progress_columns = [TextColumn("[progress.description]{task.description}"), BarColumn(), MofNCompleteColumn(), TextColumn("[progress.percentage]{task.percentage:>3.0f}%"), TimeRemainingColumn()]
+                with Progress(*progress_columns, console=self.console) as progress:
+                    target_dir_fid = await self.get_fid_by_path(dir_path)
+                    all_compressed_files = [f for f in await self.get_files_by_pid(target_dir_fid) if not f.get("dir") and _ARCHIVE_RE.search(f.get("file_name", ""))]
 
-            if not all_compressed_files:
-                self.console.print("[yellow]No supported compressed files found.[/]")
-                return
+                    if not all_compressed_files:
+                        self.console.print("[yellow]No supported compressed files found.[/]")
+                        return
 
-            # --- Task 1: Unzip ---
-            self.console.print(Panel(f"[bold cyan]Task 1: Unzipping {len(all_compressed_files)} files[/]", title="[yellow]Stage[/]", border_style="blue"))
-            successful_unzip, failed_unzip = self._unzip_task(all_compressed_files, target_dir_fid, 0.2, "Unzipping...")
-            if failed_unzip:
-                self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_unzip]), title="[bold red]Unzip Failure Report[/]", border_style="red"))
-                s_unzip_retry, _ = self._unzip_task(failed_unzip, target_dir_fid, 0.8, "Retrying unzips...")
-                successful_unzip.extend(s_unzip_retry)
+                    # --- Task 1: Unzip ---
+                    # Allow a minute of clock skew between this machine and the server's created_at timestamps (ms).
+                    unzip_started_ms = int(time.time() * 1000) - 60_000
+                    self.console.print(Panel(f"[bold cyan]Task 1: Unzipping {len(all_compressed_files)} files[/]", title="[yellow]Stage[/]", border_style="blue"))
+                    successful_unzip, failed_unzip = await self._unzip_task(all_compressed_files, target_dir_fid, "Unzipping...", progress)
+                    if failed_unzip:
+                        self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_unzip]), title="[bold red]Unzip Failure Report[/]", border_style="red"))
+                        with self._retry_pacing():
+                            s_unzip_retry, _ = await self._unzip_task(failed_unzip, target_dir_fid, "Retrying unzips...", progress)
+                        successful_unzip.extend(s_unzip_retry)
+                    self.console.print(f"[bold green]✅ {len(successful_unzip)} of {len(all_compressed_files)} archives unzipped.[/]")
 
-            if not successful_unzip:
-                self.console.print("[yellow]No files were successfully unzipped, aborting.[/]")
-                return
+                    if not successful_unzip:
+                        self.console.print("[yellow]No files were successfully unzipped, aborting.[/]")
+                        return
+
+                    # --- Task 2: Organize ---
+                    self.console.print(Panel(f"[bold cyan]Task 2: Organizing {len(successful_unzip)} folders[/]", title="[yellow]Stage[/]", border_style="blue"))
+                    self.console.print("[yellow]Waiting for server to process... (5 seconds)[/]")
+                    await asyncio.sleep(5)
+                    organized_folders, failed_organize = await self._organize_task(successful_unzip, target_dir_fid, unzip_started_ms, "Organizing...", progress)
+                    if failed_organize:
+                        self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_organize]), title="[bold red]Organization Failure Report[/]", border_style="red"))
+                        with self._retry_pacing():
+                            o_folders_retry, _ = await self._organize_task(failed_organize, target_dir_fid, unzip_started_ms, "Retrying organization...", progress)
+                        organized_folders.extend(o_folders_retry)
+
+                    if organized_folders:
+                        failed_move = await self._move_task(organized_folders, target_dir_fid, "Moving files...", progress)
+                        if failed_move:
+                            self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_move]), title="[bold red]Move Failure Report[/]", border_style="red"))
+                            with self._retry_pacing():
+                                failed_move = await self._move_task(failed_move, target_dir_fid, "Retrying move...", progress)
+                        # Folders whose contents could not be moved must not be deleted.
+                        organized_folders = [f for f in organized_folders if f not in failed_move]
+                        self.console.print(f"[bold green]✅ Contents of {len(organized_folders)} folders moved.[/]")
+
+                    # --- Task 3: Clean up empty folders ---
+                    if organized_folders:
+                        self.console.print(Panel(f"[bold cyan]Task 3: Cleaning up {len(organized_folders)} empty folders[/]", title="[yellow]Stage[/]", border_style="blue"))
+                        failed_delete = await self._cleanup_task(organized_folders, "Cleaning...", progress)
+                        if failed_delete:
+                            self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_delete]), title="[bold red]Cleanup Failure Report[/]", border_style="red"))
+                            with self._retry_pacing():
+                                failed_delete = await self._cleanup_task(failed_delete, "Retrying cleanup...", progress)
+                        self.console.print(f"[bold green]✅ {len(organized_folders) - len(failed_delete)} empty folders deleted.[/]")
+
+                    # --- Task 4: Clean up source files ---
+                    if delete_source_files:
+                        self.console.print(Panel(f"[bold cyan]Task 4: Cleaning up {len(successful_unzip)} source archives[/]", title="[yellow]Stage[/]", border_style="blue"))
+                        failed_delete_source = await self._cleanup_task(successful_unzip, "Cleaning up source files...", progress)
+                        if failed_delete_source:
+                            self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_delete_source]), title="[bold red]Source File Cleanup Failure Report[/]", border_style="red"))
+                            with self._retry_pacing():
+                                failed_delete_source = await self._cleanup_task(failed_delete_source, "Retrying source cleanup...", progress)
+                        self.console.print(f"[bold green]✅ {len(successful_unzip) - len(failed_delete_source)} source archives deleted.[/]")
 
-            # --- Task 2: Organize ---
-            self.console.print(Panel(f"[bold cyan]Task 2: Organizing {len(successful_unzip)} folders[/]", title="[yellow]Stage[/]", border_style="blue"))
-            self.console.print("[yellow]Waiting for server to process... (5 seconds)[/]")
-            time.sleep(5)
-            organized_folders, failed_organize = self._organize_task(successful_unzip, target_dir_fid, 0.2, "Organizing...")
-            if failed_organize:
-                self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_organize]), title="[bold red]Organization Failure Report[/]", border_style="red"))
-                o_folders_retry, _ = self._organize_task(failed_organize, target_dir_fid, 0.8, "Retrying organization...")
-                organized_folders.extend(o_folders_retry)
-
-            # --- Task 3: Clean up empty folders ---
-            if organized_folders:
-                self.console.print(Panel(f"[bold cyan]Task 3: Cleaning up {len(organized_folders)} empty folders[/]", title="[yellow]Stage[/]", border_style="blue"))
-                failed_delete = self._cleanup_task(organized_folders, 0.2, "Cleaning...")
-                if failed_delete:
-                    self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_delete]), title="[bold red]Cleanup Failure Report[/]", border_style="red"))
-                    self._cleanup_task(failed_delete, 0.8, "Retrying cleanup...")
-            
-            # --- Task 4: Clean up source files ---
-            if delete_source_files:
-                self.console.print(Panel(f"[bold cyan]Task 4: Cleaning up {len(successful_unzip)} source archives[/]", title="[yellow]Stage[/]", border_style="blue"))
-                failed_delete_source = self._cleanup_task(successful_unzip, 0.2, "Cleaning up source files...")
-                if failed_delete_source:
-                    self.console.print(Panel("\n".join([f"- {f['file_name']}" for f in failed_delete_source]), title="[bold red]Source File Cleanup Failure Report[/]", border_style="red"))
-                    self._cleanup_task(failed_delete_source, 0.8, "Retrying source cleanup...")
-
-            self.console.print(Panel("[bold green]All tasks completed![/]", title="[yellow]Status[/]", border_style="green"))
+                    self.console.print(Panel("[bold green]All tasks completed![/]", title="[yellow]Status[/]", border_style="green"))
 
         except (ValueError, FileNotFoundError) as e:
             self.console.print(Panel(f"[bold red]Initialization or configuration error:[/] {e}", title="[red]Error[/]", border_style="red"))
@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import json
 import os
 from rich.console import Console
@@ -36,7 +37,7 @@ def main():
 
         should_delete = Confirm.ask("[bold yellow]Do you want to delete the original compressed files after successful processing?[/yellow]", default=False)
         
-        api.unzip_all_in_path(target_directory, delete_source_files=should_delete)
+        asyncio.run(api.unzip_all_in_path(target_directory, delete_source_files=should_delete))
 
     except (ValueError, FileNotFoundError) as e:
         console.print(Panel(f"[bold red]Error:[/] {e}", title="[red]Error[/]", border_style="red"))